@@ -1,8 +1,10 @@
-import sys
 import os
+
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
+from plotly.colors import qualitative
 
 # ---------------------------
 # App Configuration
@@ -13,14 +15,112 @@ st.title("🏏 IPL Data Analysis Dashboard")
 # ---------------------------
 # Load Data
 # ---------------------------
-def load_data(path="matches.csv"):
-    """Load IPL match data or show an error if missing."""
+# Only the columns the charts below use are read. Each has a few dozen
+# distinct values, so reading them as categories keeps counts on small int codes.
+MATCH_DTYPES = {
+    'season': 'category',
+    'venue': 'category',
+    'winner': 'category',
+}
+
+def read_matches(path):
+    """Parse the match CSV with only the charted columns."""
+    return pd.read_csv(path, engine='pyarrow', dtype_backend='numpy_nullable',
+                       usecols=list(MATCH_DTYPES), dtype=MATCH_DTYPES)
+
+def load_figures(path="matches.csv"):
+    """Load the IPL match charts or show an error if missing."""
     if not os.path.exists(path):
         st.error("⚠️ File 'matches.csv' not found. Please upload it to this folder.")
         st.stop()
-    return pd.read_csv(path)
+    return chart_figures(path, os.path.getmtime(path))
+
+def cat_counts(series):
+    """Count every category of a categorical series with one bincount over its codes."""
+    codes = series.cat.codes.to_numpy()
+    categories = series.cat.categories
+    return pd.Series(np.bincount(codes[codes >= 0], minlength=len(categories)), index=categories)
+
+def top_k_counts(series, k=10):
+    """Return the k most frequent values of a series, most frequent first (ties by first appearance)."""
+    # factorize numbers values in order of first appearance (on a categorical
+    # it works on the int codes), so the stable sort below breaks ties that way
+    codes, uniques = pd.factorize(series)
+    counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(uniques)), index=uniques)
+    values = counts.to_numpy()
+    if 0 < k < len(values):
+        # Keep every value tied with the k-th largest count so the stable sort
+        # below, not the partition, decides which of them make the cut
+        kth = np.partition(values, len(values) - k)[len(values) - k]
+        top = np.flatnonzero(values >= kth)
+    else:
+        top = np.arange(len(values))
+    top = top[np.argsort(-values[top], kind='stable')][:k]
+    return counts.iloc[top]
+
+def chart_tables(matches):
+    """Aggregate the small table behind every chart."""
+    team_wins = top_k_counts(matches['winner'], k=10).reset_index()
+    team_wins.columns = ['Team', 'Wins']
+
+    season_matches = cat_counts(matches['season']).reset_index()
+    season_matches.columns = ['Season', 'Matches']
+
+    venue_counts = top_k_counts(matches['venue'], k=10).reset_index()
+    venue_counts.columns = ['Venue', 'Matches']
+
+    return {
+        'team_wins': team_wins,
+        'season_matches': season_matches,
+        'venue_counts': venue_counts,
+        # The top 5 are the first rows of the already-ranked top 10
+        'top5_wins': team_wins.head(5),
+    }
+
+def bar_chart(df, x, y, title):
+    """Build a labelled bar chart directly with graph_objects (one colour per bar)."""
+    palette = qualitative.Plotly
+    return go.Figure(
+        go.Bar(
+            x=df[x].to_numpy(),
+            y=df[y].to_numpy(),
+            text=df[y].to_numpy(),
+            textposition='outside',
+            hovertemplate=f'{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>',
+            marker_color=[palette[i % len(palette)] for i in range(len(df))],
+        ),
+        layout={'title': title, 'xaxis_title': x, 'yaxis_title': y},
+    )
+
+def line_chart(df, x, y, title):
+    """Build a WebGL line chart with markers directly with graph_objects."""
+    return go.Figure(
+        go.Scattergl(
+            x=df[x].to_numpy(),
+            y=df[y].to_numpy(),
+            mode='lines+markers',
+            hovertemplate=f'{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>',
+        ),
+        # A constant uirevision keeps the user's zoom/pan across reruns
+        layout={'title': title, 'xaxis_title': x, 'yaxis_title': y, 'uirevision': 'constant'},
+    )
+
+# This is the app's only cache: parsing, counting and figure building all
+# happen once per file version. cache_resource hands back the same Figure
+# objects instead of unpickling (and so re-validating) them per rerun;
+# st.plotly_chart only reads them.
+@st.cache_resource(show_spinner=False, max_entries=4)
+def chart_figures(path, mtime):
+    """Build every chart's figure once per file version; `mtime` is only part of the cache key."""
+    tables = chart_tables(read_matches(path))
+    return {
+        'team_wins': bar_chart(tables['team_wins'], x='Team', y='Wins', title='Top 10 Teams by Wins'),
+        'season_matches': line_chart(tables['season_matches'], x='Season', y='Matches', title='Matches per Season'),
+        'venue_counts': bar_chart(tables['venue_counts'], x='Venue', y='Matches', title='Top 10 Venues by Matches Hosted'),
+        'top5_wins': bar_chart(tables['top5_wins'], x='Team', y='Wins', title='Top 5 Teams by Wins'),
+    }
 
-matches = load_data()
+figures = load_figures()
 
 # ---------------------------
 # Dashboard Sections
@@ -28,55 +128,19 @@ matches = load_data()
 
 # 🥇 Top Winning Teams
 st.subheader("🥇 Top Winning Teams")
-team_wins = matches['winner'].dropna().value_counts().reset_index()
-team_wins.columns = ['Team', 'Wins']
-fig1 = px.bar(
-    team_wins.head(10),
-    x='Team',
-    y='Wins',
-    color='Team',
-    title='Top 10 Teams by Wins',
-    text='Wins'
-)
-fig1.update_traces(textposition='outside')
-st.plotly_chart(fig1, use_container_width=True)
+st.plotly_chart(figures['team_wins'], use_container_width=True)
 
 # 📈 Matches per Season
 st.subheader("📈 Matches per Season")
-season_matches = matches['season'].value_counts().sort_index().reset_index()
-season_matches.columns = ['Season', 'Matches']
-fig2 = px.line(
-    season_matches,
-    x='Season',
-    y='Matches',
-    markers=True,
-    title='Matches per Season',
-)
-st.plotly_chart(fig2, use_container_width=True)
+st.plotly_chart(figures['season_matches'], use_container_width=True)
 
 # 🏟️ Top Venues
 st.subheader("🏟️ Top Venues by Matches Hosted")
-venue_counts = matches['venue'].value_counts().head(10).reset_index()
-venue_counts.columns = ['Venue', 'Matches']
-fig3 = px.bar(
-    venue_counts,
-    x='Venue',
-    y='Matches',
-    color='Venue',
-    title='Top 10 Venues by Matches Hosted',
-    text='Matches'
-)
-fig3.update_traces(textposition='outside')
-st.plotly_chart(fig3, use_container_width=True)
+st.plotly_chart(figures['venue_counts'], use_container_width=True)
 
 # 1️⃣ Top 5 Teams by Wins
 # ---------------------------
 st.subheader("🥇 Top 5 Teams by Wins")
-team_wins = matches['winner'].dropna().value_counts().reset_index().head(5)
-team_wins.columns = ['Team', 'Wins']
-fig1 = px.bar(team_wins, x='Team', y='Wins', color='Team', text='Wins',
-              title='Top 5 Teams by Wins')
-fig1.update_traces(textposition='outside')
-st.plotly_chart(fig1, use_container_width=True)
+st.plotly_chart(figures['top5_wins'], use_container_width=True)
 
 
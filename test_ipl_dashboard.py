@@ -0,0 +1,83 @@
+import importlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+REPO = Path(__file__).parent
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    # Importing the script runs it in Streamlit's bare mode against matches.csv
+    monkeypatch.chdir(REPO)
+    return importlib.import_module("ipl_dashboard")
+
+
+def test_top_k_counts_breaks_tie_at_kth_place_by_first_appearance(dashboard):
+    series = pd.Series(list("jjjjeeeiiihhh"))
+    top = dashboard.top_k_counts(series, k=3)
+    assert top.index.tolist() == ["j", "e", "i"]
+    assert top.tolist() == [4, 3, 3]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_top_k_counts_matches_value_counts(dashboard, seed):
+    rng = np.random.default_rng(seed)
+    series = pd.Series(rng.choice(list("abcdefghij"), size=30)).astype(object)
+    for k in (1, 3, 5, 10, 12):
+        expected = series.value_counts().head(k)
+        for data in (series, series.astype("category")):
+            top = dashboard.top_k_counts(data, k=k)
+            assert top.index.tolist() == expected.index.tolist()
+            assert top.tolist() == expected.tolist()
+
+
+def test_top_k_counts_orders_categorical_ties_by_first_appearance(dashboard):
+    series = pd.Series(list("zzbbaac")).astype("category")
+    top = dashboard.top_k_counts(series, k=3)
+    assert top.index.tolist() == ["z", "b", "a"]
+
+
+def test_cat_counts_matches_sorted_value_counts(dashboard):
+    series = pd.Series(["2011", None, "2009/10", "2009", "2011", "2007/08", None, "2009"])
+    categorical = series.astype(pd.CategoricalDtype(["2007/08", "2009", "2009/10", "2011"]))
+    expected = series.value_counts().sort_index()
+    counts = dashboard.cat_counts(categorical)
+    assert counts.index.tolist() == expected.index.tolist()
+    assert counts.tolist() == expected.tolist()
+
+
+def test_cat_counts_drops_missing_values(dashboard):
+    counts = dashboard.cat_counts(pd.Series(["b", None, "a", None]).astype("category"))
+    assert counts.to_dict() == {"a": 1, "b": 1}
+
+
+def test_edited_matches_csv_is_picked_up_on_rerun(tmp_path, monkeypatch):
+    shutil.copy(REPO / "ipl_dashboard.py", tmp_path)
+    csv = tmp_path / "matches.csv"
+    shutil.copy(REPO / "matches.csv", csv)
+    monkeypatch.chdir(tmp_path)
+
+    def top_teams(at):
+        return json.loads(at.get("plotly_chart")[0].proto.spec)["data"][0]["x"]
+
+    at = AppTest.from_file(str(tmp_path / "ipl_dashboard.py"), default_timeout=60).run()
+    before = top_teams(at)
+
+    # Keep only the first 200 matches and move the mtime forward so the edit is visible
+    lines = csv.read_text().splitlines(keepends=True)
+    csv.write_text("".join(lines[:201]))
+    mtime = os.path.getmtime(csv) + 10
+    os.utime(csv, (mtime, mtime))
+
+    at.run()
+    after = top_teams(at)
+    expected = pd.read_csv(csv)["winner"].value_counts().head(10).index.tolist()
+    assert after != before
+    assert after == expected